@@ -1,11 +1,37 @@
 import asyncio
 import json
+import random
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from patchright.async_api import APIRequestContext
 
 from core.logger import log
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder is used otherwise.
+    orjson = None
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Returned by _fetch_result for failures worth retrying (transport errors, HTTP 5xx).
+_TRANSIENT: Dict[str, Any] = {}
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 
 class CaptchaAPIService:
     """
@@ -21,12 +47,33 @@ class CaptchaAPIService:
         *,
         poll_interval: float = 1.0,
         max_wait_time: float = 15.0,
+        min_poll_interval: float = 0.25,
+        max_poll_interval: float = 4.0,
+        poll_backoff: float = 1.6,
+        long_poll: bool = True,
     ) -> None:
         self._request_context = request_context
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.poll_interval = poll_interval
         self.max_wait_time = max_wait_time
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max(min_poll_interval, max_poll_interval)
+        self.poll_backoff = max(1.0, poll_backoff)
+        self.long_poll = long_poll
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        # Request bodies are assembled from these pre-encoded prefixes so the
+        # client key is serialized once instead of on every poll.
+        self._api_key = value
+        encoded_key = _dumps(value)
+        self._create_task_prefix = b'{"clientKey":' + encoded_key + b',"type":'
+        self._get_result_prefix = b'{"clientKey":' + encoded_key + b',"taskId":'
 
     async def create_task(
         self,
@@ -37,16 +84,18 @@ class CaptchaAPIService:
         """
         Create a Multibot task and return its identifier, or None on failure.
         """
-        payload = {
-            "clientKey": self.api_key,
-            "type": task_type,
-            "task": task_payload,
-        }
+        body = (
+            self._create_task_prefix
+            + _dumps(task_type)
+            + b',"task":'
+            + _dumps(task_payload)
+            + b"}"
+        )
         try:
             response = await self._request_context.post(
                 f"{self.base_url}/createTask/index.php",
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
+                data=body,
+                headers=_JSON_HEADERS,
                 timeout=30 * 1000,
             )
         except Exception as exc:  # noqa: BLE001
@@ -57,7 +106,11 @@ class CaptchaAPIService:
             log.failure(f"Multibot API returned HTTP {response.status}")
             return None
 
-        data = await response.json()
+        try:
+            data = _loads(await response.body())
+        except ValueError as exc:
+            log.failure(f"Malformed createTask response: {exc}")
+            return None
         if data.get("errorId"):
             log.failure(
                 f"createTask error [{data.get('errorCode')}]: {data.get('errorDescription')}"
@@ -76,16 +129,47 @@ class CaptchaAPIService:
         task_id: str,
         *,
         return_raw: bool = False,
+        poll_interval: Optional[float] = None,
+        poll_backoff: Optional[float] = None,
+        poll_max: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Poll Multibot for the task result.
         Returns the parsed answer, or the raw response when return_raw=True.
+
+        The interval grows by poll_backoff after every not-ready response (at
+        least 2x after a transport error or HTTP 5xx; API errors, HTTP 4xx and
+        malformed bodies abort immediately), capped at poll_max and jittered by
+        +/-20%. Each of poll_interval, poll_backoff and poll_max defaults to the
+        value configured on the service.
+        With long_poll enabled each request asks the server to hold it open for
+        the remaining budget, and time spent inside a request counts towards
+        the next interval, so a server honoring the hint is never slept on.
         """
-        elapsed = 0.0
-        while elapsed <= self.max_wait_time:
-            result = await self._fetch_result(task_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_time
+        max_interval = self.max_poll_interval if poll_max is None else max(self.min_poll_interval, poll_max)
+        backoff = self.poll_backoff if poll_backoff is None else max(1.0, poll_backoff)
+        interval = min(
+            max_interval,
+            max(self.min_poll_interval, self.poll_interval if poll_interval is None else poll_interval),
+        )
+        while True:
+            fetch_started = loop.time()
+            remaining = deadline - fetch_started
+            if remaining <= 0:
+                break
+            wait_hint = remaining if self.long_poll else 0.0
+            result = await self._fetch_result(task_id, wait_hint=wait_hint)
             if result is None:
                 return None
+            if result is _TRANSIENT:
+                # Transport/server hiccups are retried with a steeper backoff.
+                interval = min(max_interval, interval * max(2.0, backoff))
+                pause = min(interval * random.uniform(0.8, 1.2), deadline - loop.time())
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                continue
 
             status = result.get("status")
             if status == "ready":
@@ -102,8 +186,14 @@ class CaptchaAPIService:
                 log.failure("Multibot failed to solve the challenge")
                 return None
 
-            await asyncio.sleep(self.poll_interval)
-            elapsed += self.poll_interval
+            now = loop.time()
+            pause = min(
+                interval * random.uniform(0.8, 1.2) - (now - fetch_started),
+                deadline - now,
+            )
+            if pause > 0:
+                await asyncio.sleep(pause)
+            interval = min(max_interval, interval * backoff)
 
         log.failure(
             f"Timed out waiting for task {task_id} after {self.max_wait_time} seconds"
@@ -144,6 +234,31 @@ class CaptchaAPIService:
             log.failure("Multibot returned an empty answers list for humanMove")
             return None
 
+        try:
+            # Fast path for well-formed payloads: [{"path": [[x, y, delay_ms], ...]}, ...]
+            normalized = [
+                (
+                    float(entry[0]),
+                    float(entry[1]),
+                    float(entry[2]) if len(entry) > 2 and entry[2] is not None else 0.0,
+                )
+                for entry in chain.from_iterable(map(itemgetter("path"), answers))
+                if entry.__class__ is list and len(entry) >= 2
+            ]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            normalized = self._normalize_human_path(answers)
+
+        if not normalized:
+            log.failure("Failed to normalize humanMove trajectory")
+            return None
+
+        return normalized
+
+    @staticmethod
+    def _normalize_human_path(answers: List[Any]) -> List[Tuple[float, float, float]]:
+        """
+        Defensive humanMove normalizer that skips malformed segments and entries.
+        """
         normalized: List[Tuple[float, float, float]] = []
         for segment in answers:
             if not isinstance(segment, dict):
@@ -154,8 +269,11 @@ class CaptchaAPIService:
             for entry in path:
                 if not isinstance(entry, (list, tuple)) or len(entry) < 2:
                     continue
-                x = float(entry[0])
-                y = float(entry[1])
+                try:
+                    x = float(entry[0])
+                    y = float(entry[1])
+                except (TypeError, ValueError):
+                    continue
                 delay_ms = 0.0
                 if len(entry) > 2 and entry[2] is not None:
                     try:
@@ -163,36 +281,47 @@ class CaptchaAPIService:
                     except (TypeError, ValueError):
                         delay_ms = 0.0
                 normalized.append((x, y, delay_ms))
-
-        if not normalized:
-            log.failure("Failed to normalize humanMove trajectory")
-            return None
-
         return normalized
 
-    async def _fetch_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_result(
+        self,
+        task_id: str,
+        *,
+        wait_hint: float = 0.0,
+    ) -> Optional[Dict[str, Any]]:
         """
         Helper to retrieve a task result payload from Multibot.
+        wait_hint: seconds the server may hold the request open until the task is ready.
+        Returns _TRANSIENT for transport errors and HTTP 5xx, None for terminal failures.
         """
-        payload = {"clientKey": self.api_key, "taskId": task_id}
+        wait_seconds = int(wait_hint)
+        body = self._get_result_prefix + _dumps(task_id)
+        if wait_seconds > 0:
+            body += b',"waitSeconds":%d}' % wait_seconds
+        else:
+            body += b"}"
         try:
             response = await self._request_context.post(
                 f"{self.base_url}/getTaskResult/index.php",
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                timeout=30 * 1000,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=(30 + wait_seconds) * 1000,
             )
         except Exception as exc:  # noqa: BLE001
             log.failure(f"Failed to fetch task {task_id} result: {exc}")
-            return None
+            return _TRANSIENT
 
         if not response.ok:
             log.failure(
                 f"HTTP {response.status} while retrieving result for task {task_id}"
             )
-            return None
+            return _TRANSIENT if response.status >= 500 else None
 
-        data = await response.json()
+        try:
+            data = _loads(await response.body())
+        except ValueError as exc:
+            log.failure(f"Malformed result for task {task_id}: {exc}")
+            return None
         if data.get("errorId"):
             log.failure(
                 f"getTaskResult error [{data.get('errorCode')}]: {data.get('errorDescription')}"
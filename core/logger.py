@@ -1,9 +1,33 @@
-from datetime import datetime
 import os
-os.system('color')
+import sys
+import time
+from typing import Optional
+
+
+def _enable_windows_ansi() -> None:
+    # Turn on ENABLE_VIRTUAL_TERMINAL_PROCESSING instead of spawning `color`.
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+
+if sys.platform == "win32":
+    _enable_windows_ansi()
+
 
 class logger:
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    FAILURE = 40
+
     def __init__(self):
+        # Messages below this level return before any formatting work.
+        self.level: int = self._parse_level(os.getenv("LOG_LEVEL"))
         self.WHITE: str = "\u001b[37m"
         self.MAGENTA: str = "\033[38;5;97m"
         self.MAGENTAA: str = "\033[38;2;157;38;255m"
@@ -15,30 +39,61 @@ class logger:
         self.CYAN: str = "\033[96m"
         self.GRAY: str = "\033[38;5;244m"
 
+        # Constant colour fragments surrounding the variable parts of a line.
+        self._tmpl_prefix = f" {self.PINK}[{self.MAGENTA}"
+        self._tmpl_mid = f"{self.PINK}] {self.WHITE}| {self.PINK}["
+        self._tmpl_suffix = f"{self.PINK}] {self.WHITE}-> {self.PINK}[{self.MAGENTA}"
+        self._tmpl_end = f"{self.PINK}]"
+        self._tmpl_timer = f" {self.MAGENTAA}In{self.WHITE} -> {self.MAGENTAA}"
+
+    @classmethod
+    def _parse_level(cls, value: Optional[str]) -> int:
+        # Accepts a number or a level name (any case); anything else means INFO.
+        if value is None:
+            return cls.INFO
+        name = value.strip().upper()
+        if name in ("DEBUG", "INFO", "WARNING", "FAILURE"):
+            return getattr(cls, name)
+        try:
+            return int(name)
+        except ValueError:
+            return cls.INFO
+
     def get_time(self) -> str:
-        return datetime.now().strftime("%H:%M:%S")
+        return time.strftime("%H:%M:%S", time.localtime())
     
     def message(self, level: str, message: str, start: int = None, end: int = None) -> str:
-        time_now = f" {self.PINK}[{self.MAGENTA}{self.get_time()}{self.PINK}] {self.WHITE}|"
-        timer = f" {self.MAGENTAA}In{self.WHITE} -> {self.MAGENTAA}{str(end - start)[:5]} Sec" if start and end else ""
-        return f"{time_now} {self.PINK}[{level}{self.PINK}] {self.WHITE}-> {self.PINK}[{self.MAGENTA}{message}{self.PINK}]{timer}"
+        timer = f"{self._tmpl_timer}{str(end - start)[:5]} Sec" if start is not None and end is not None else ""
+        return f"{self._tmpl_prefix}{self.get_time()}{self._tmpl_mid}{level}{self._tmpl_suffix}{message}{self._tmpl_end}{timer}"
     
     def success(self, message: str, start: int = None, end: int = None, level: str = "Success") -> None:
+        if self.level > self.INFO:
+            return
         print(self.message(f"{self.GREEN}{level}", f"{self.GREEN}{message}", start, end))
 
     def info(self, message: str, start: int = None, end: int = None, level: str = "Info") -> None:
+        if self.level > self.INFO:
+            return
         print(self.message(f"{self.BLUE}{level}", f"{self.BLUE}{message}", start, end))
 
     def failure(self, message: str, start: int = None, end: int = None, level: str = "Failure") -> None:
+        if self.level > self.FAILURE:
+            return
         print(self.message(f"{self.RED}{level}", f"{self.RED}{message}", start, end))
     
     def warning(self, message: str, start: int = None, end: int = None, level: str = "Warning") -> None:
+        if self.level > self.WARNING:
+            return
         print(self.message(f"{self.YELLOW}{level}", f"{self.YELLOW}{message}", start, end))
     
     def captcha(self, message: str, start: int = None, end: int = None, level: str = "hCaptcha") -> None:
+        if self.level > self.INFO:
+            return
         print(self.message(f"{self.CYAN}{level}", f"{self.CYAN}{message}", start, end))
 
     def debug(self, message: str, start: int = None, end: int = None, level: str = "Debug") -> None:
+        if self.level > self.DEBUG:
+            return
         print(self.message(f"{self.GRAY}{level}", f"{self.GRAY}{message}", start, end))
 
 log = logger()
\ No newline at end of file
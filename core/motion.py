@@ -1,22 +1,56 @@
 import asyncio
+import functools
 import math
 import random
+from array import array
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from patchright.async_api import Page
+from patchright.async_api import CDPSession, Page
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     x: float
     y: float
 
 
+# Spacing between consecutive points of a generated path (~125 Hz, a typical
+# mouse report rate), so the browser sees a timed trajectory, not one burst.
+_STEP_INTERVAL = 0.008
+
+
+@functools.lru_cache(maxsize=64)
+def _bernstein(step_count: int) -> Tuple[Tuple[float, float, float, float], ...]:
+    """
+    Cubic Bernstein weights for t = 1/n .. 1, cached per step count.
+    """
+    weights = []
+    for i in range(1, step_count + 1):
+        t = i / step_count
+        mt = 1 - t
+        mt2 = mt * mt
+        t2 = t * t
+        weights.append((mt2 * mt, 3 * mt2 * t, 3 * mt * t2, t2 * t))
+    return tuple(weights)
+
+
 class MouseMotion:
     """
     Simulates pointer movement on the page, supporting human-like trajectories.
     """
 
+    __slots__ = (
+        "page",
+        "_position",
+        "_human_trace",
+        "_cdp",
+        "_cdp_supported",
+        "_rng",
+        "_viewport",
+        "_pending_sends",
+    )
+
     def __init__(
         self,
         page: Page,
@@ -24,6 +58,13 @@ class MouseMotion:
         self.page = page
         self._position: Optional[Point] = None
         self._human_trace: Optional[List[Tuple[float, float]]] = None
+        self._cdp: Optional[CDPSession] = None
+        self._cdp_supported = True
+        self._rng = random.Random()
+        self._viewport: Optional[Dict[str, int]] = None
+        # Strong refs to in-flight CDP sends, so a cancelled caller cannot leave
+        # them to be garbage-collected while still pending.
+        self._pending_sends: Set["asyncio.Task[Any]"] = set()
 
     @property
     def current_position(self) -> Optional[Tuple[float, float]]:
@@ -44,15 +85,17 @@ class MouseMotion:
     async def move_to(self, x: float, y: float, *, record_trace: bool = False) -> None:
         target = Point(x, y)
 
-        start = self._position or await self._init_position()
-        path = self._build_path(start, target)
+        # The path starts right away, so the pre-roll move is only needed for traces.
+        start = self._position or await self._init_position(dispatch=record_trace)
         if record_trace:
-            self._human_trace = [(start.x, start.y)] + [(point.x, point.y) for point in path]
+            coords = self._build_path(start, target)
+            path = list(zip(coords[0::2], coords[1::2]))
+            self._human_trace = [(start.x, start.y)] + path
+            await self._dispatch_path(path)
         else:
             self._human_trace = None
-
-        for point in path:
-            await self.page.mouse.move(point.x, point.y, steps=1)
+            # Points are dispatched as they are generated, with no intermediate list.
+            await self._dispatch_path(self._iter_path(start, target))
 
         self._position = Point(target.x, target.y)
 
@@ -65,7 +108,7 @@ class MouseMotion:
         steps: Optional[int] = None,
     ) -> None:
         if self._position is None:
-            await self._init_position()
+            await self._init_position(dispatch=False)
 
         target = Point(x, y)
         pause = max(0.0, delay or 0.0)
@@ -80,10 +123,39 @@ class MouseMotion:
         self,
         points: Sequence[Tuple[float, float, Optional[float]]],
     ) -> None:
+        """
+        Replays (x, y, delay_seconds) points, each delay preceding its move.
+        With CDP available the moves are sent on an absolute timeline and their
+        acks are reaped at the end, so per-event round-trips do not stretch the
+        delays; the final point goes through page.mouse to keep its state in sync.
+        """
         if not points:
             return
-        for x, y, delay in points:
-            await self.move_direct(x, y, delay=delay)
+
+        cdp = await self._get_cdp()
+        if cdp is None:
+            for x, y, delay in points:
+                await self.move_direct(x, y, delay=delay)
+            return
+
+        if self._position is None:
+            await self._init_position(dispatch=False)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        sends = []
+        for index, (x, y, delay) in enumerate(points):
+            deadline += max(0.0, delay or 0.0)
+            pause = deadline - loop.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            if index < len(points) - 1:
+                sends.append(self._send_mouse_moved(cdp, x, y))
+
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
+        await self.page.mouse.move(x, y, steps=1)
+        self._position = Point(x, y)
 
     async def click(
         self,
@@ -95,20 +167,14 @@ class MouseMotion:
         record_trace: bool = False,
     ) -> None:
         await self.move_to(x, y, record_trace=record_trace)
-        if delay_before > 0:
-            await asyncio.sleep(delay_before)
-        await self.page.mouse.down()
-        await self.page.mouse.up()
-        if delay_after > 0:
-            await asyncio.sleep(delay_after)
+        await self.click_here(delay_before=delay_before, delay_after=delay_after)
 
     async def drag_and_drop(self, start: Point, end: Point, steps: int = 30) -> None:
         await self.move_to(start.x, start.y)
         await self.page.mouse.down()
 
-        path = self._build_path(start, end, steps=max(10, int(steps * 1.2)))
-        for point in path:
-            await self.page.mouse.move(point.x, point.y, steps=1)
+        path = self._iter_path(start, end, steps=max(10, int(steps * 1.2)))
+        await self._dispatch_path(path, buttons=1)
 
         await self.page.mouse.up()
         self._position = Point(end.x, end.y)
@@ -119,6 +185,11 @@ class MouseMotion:
         delay_before: float = 0.0,
         delay_after: float = 0.0,
     ) -> None:
+        if delay_before <= 0 and delay_after <= 0 and self._position is not None:
+            # A single mouse.click call replaces the separate down/up round-trips.
+            await self.page.mouse.click(self._position.x, self._position.y)
+            return
+
         if delay_before > 0:
             await asyncio.sleep(delay_before)
         await self.page.mouse.down()
@@ -126,58 +197,138 @@ class MouseMotion:
         if delay_after > 0:
             await asyncio.sleep(delay_after)
 
-    async def _init_position(self) -> Point:
-        viewport = self.page.viewport_size
+    async def _get_cdp(self) -> Optional[CDPSession]:
+        if self._cdp is None and self._cdp_supported:
+            try:
+                self._cdp = await self.page.context.new_cdp_session(self.page)
+            except Exception:  # noqa: BLE001
+                # CDP sessions are Chromium-only; other engines use page.mouse.
+                self._cdp_supported = False
+        return self._cdp
+
+    async def _dispatch_path(
+        self,
+        points: Iterable[Tuple[float, float]],
+        *,
+        buttons: int = 0,
+    ) -> None:
+        """
+        Sends every point but the last over CDP on an absolute timeline spaced by
+        _STEP_INTERVAL, without awaiting each ack, and reaps the acks together. The
+        last point goes through page.mouse so Playwright's tracked cursor position
+        (used by mouse.down/up) stays in sync.
+        """
+        cdp = await self._get_cdp()
+        if cdp is None:
+            for x, y in points:
+                await self.page.mouse.move(x, y, steps=1)
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        sends = []
+        last: Optional[Tuple[float, float]] = None
+        for point in points:
+            if last is not None:
+                deadline += _STEP_INTERVAL
+                pause = deadline - loop.time()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                sends.append(self._send_mouse_moved(cdp, last[0], last[1], buttons=buttons))
+            last = point
+        if sends:
+            pause = deadline + _STEP_INTERVAL - loop.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            await asyncio.gather(*sends, return_exceptions=True)
+
+        if last is not None:
+            await self.page.mouse.move(last[0], last[1], steps=1)
+
+    def _viewport_size(self) -> Dict[str, int]:
+        if self._viewport is None:
+            self._viewport = self.page.viewport_size or {}
+        return self._viewport
+
+    def _send_mouse_moved(
+        self,
+        cdp: CDPSession,
+        x: float,
+        y: float,
+        *,
+        buttons: int = 0,
+    ) -> "asyncio.Task[Any]":
+        """
+        Schedules a raw mouseMoved event without waiting for its ack.
+        """
+        task = asyncio.get_running_loop().create_task(
+            cdp.send(
+                "Input.dispatchMouseEvent",
+                {
+                    "type": "mouseMoved",
+                    "x": x,
+                    "y": y,
+                    "button": "left" if buttons else "none",
+                    "buttons": buttons,
+                },
+            )
+        )
+        self._pending_sends.add(task)
+        task.add_done_callback(self._pending_sends.discard)
+        return task
+
+    async def _init_position(self, *, dispatch: bool = True) -> Point:
+        """
+        Picks a random starting cursor position; dispatch=False only records it,
+        for callers that move the pointer immediately afterwards anyway.
+        """
+        viewport = self._viewport_size()
         if viewport:
             start = Point(
-                x=random.uniform(viewport["width"] * 0.2, viewport["width"] * 0.8),
-                y=random.uniform(viewport["height"] * 0.2, viewport["height"] * 0.8),
+                x=self._rng.uniform(viewport["width"] * 0.2, viewport["width"] * 0.8),
+                y=self._rng.uniform(viewport["height"] * 0.2, viewport["height"] * 0.8),
             )
         else:
             # Fallback when viewport is undefined
-            start = Point(x=random.uniform(200, 600), y=random.uniform(200, 500))
+            start = Point(x=self._rng.uniform(200, 600), y=self._rng.uniform(200, 500))
 
-        await self.page.mouse.move(start.x, start.y)
+        if dispatch:
+            await self.page.mouse.move(start.x, start.y)
         self._position = start
         return start
 
-    def _build_path(self, start: Point, end: Point, steps: Optional[int] = None) -> List[Point]:
-        distance = math.dist((start.x, start.y), (end.x, end.y))
+    def _build_path(self, start: Point, end: Point, steps: Optional[int] = None) -> array:
+        """
+        Materializes the path as an interleaved array('d', [x0, y0, x1, y1, ...]).
+        """
+        return array("d", chain.from_iterable(self._iter_path(start, end, steps)))
+
+    def _iter_path(
+        self,
+        start: Point,
+        end: Point,
+        steps: Optional[int] = None,
+    ) -> Iterator[Tuple[float, float]]:
+        dx = end.x - start.x
+        dy = end.y - start.y
+        distance = math.hypot(dx, dy)
         step_count = steps or max(12, min(45, int(distance / 12)))
 
         control_scale = max(distance * 0.25, 40)
-        angle = math.atan2(end.y - start.y, end.x - start.x)
-        control_angle = angle + random.uniform(-0.9, 0.9)
+        control_angle = math.atan2(dy, dx) + self._rng.uniform(-0.9, 0.9)
+        offset_x = math.cos(control_angle) * control_scale
+        offset_y = math.sin(control_angle) * control_scale
 
-        control1 = Point(
-            x=start.x + math.cos(control_angle) * control_scale,
-            y=start.y + math.sin(control_angle) * control_scale,
-        )
-        control2 = Point(
-            x=end.x - math.cos(control_angle) * control_scale,
-            y=end.y - math.sin(control_angle) * control_scale,
-        )
-
-        path: List[Point] = []
-        for i in range(1, step_count + 1):
-            t = i / step_count
-            x = (
-                (1 - t) ** 3 * start.x
-                + 3 * (1 - t) ** 2 * t * control1.x
-                + 3 * (1 - t) * t**2 * control2.x
-                + t**3 * end.x
-            )
-            y = (
-                (1 - t) ** 3 * start.y
-                + 3 * (1 - t) ** 2 * t * control1.y
-                + 3 * (1 - t) * t**2 * control2.y
-                + t**3 * end.y
-            )
+        sx, sy = start.x, start.y
+        ex, ey = end.x, end.y
+        c1x, c1y = sx + offset_x, sy + offset_y
+        c2x, c2y = ex - offset_x, ey - offset_y
+        jitter = min(6, max(1.2, distance / 60))
+        rand = self._rng.random
 
-            jitter = min(6, max(1.2, distance / 60))
-            x += random.uniform(-jitter, jitter)
-            y += random.uniform(-jitter, jitter)
-            path.append(Point(x=x, y=y))
+        for b0, b1, b2, b3 in _bernstein(step_count):
+            x = b0 * sx + b1 * c1x + b2 * c2x + b3 * ex + (rand() * 2.0 - 1.0) * jitter
+            y = b0 * sy + b1 * c1y + b2 * c2y + b3 * ey + (rand() * 2.0 - 1.0) * jitter
+            yield (x, y)
 
-        path.append(end)
-        return path
+        yield (ex, ey)
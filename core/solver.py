@@ -1,7 +1,7 @@
 import asyncio
-import base64
 import random
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import weakref
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from patchright.async_api import (
     ElementHandle,
@@ -12,10 +12,180 @@ from patchright.async_api import (
     TimeoutError as PatchrightTimeoutError,
 )
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib encoder.
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from core.api_service import CaptchaAPIService
 from core.logger import log
 from core.motion import MouseMotion, Point
 
+# Concrete runtime guard for JSON arrays; cheaper than the Sequence ABC check.
+_LT = (list, tuple)
+# JSON numbers; compared as-is without going through float().
+_NUMERIC = (float, int)
+# hCaptcha's submit button, with the generic form button as a fallback, in one query.
+_SUBMIT_SELECTOR = '.button-submit, button[type="submit"]'
+# Fixed step count for canvas drags, so every drag reuses one cached Bezier weight table.
+_DRAG_STEPS = 35
+# Action keys that may carry canvas coordinates (a path, or a single start/end point).
+_CANVAS_POINT_KEYS = ("path", "start", "end")
+
+
+# DOM probes installed on first use in each probed frame as non-enumerable window.__hsolve helpers,
+# so hot-path evaluates only ship a short call expression. In the challenge frame a
+# MutationObserver also pushes crumb/language changes to the __hsolveState binding.
+_PROBES_SCRIPT = """
+(() => {
+    if (window.__hsolve) {
+        return;
+    }
+    const probes = {
+        hasPrompt() {
+            return !!document.querySelector('h2.prompt-text');
+        },
+        pulseHidden() {
+            const pulseElement = document.querySelector("#anchor-state > div.pulse");
+            if (!pulseElement) {
+                return false;
+            }
+            return window.getComputedStyle(pulseElement).display === "none";
+        },
+        isLastTask() {
+            const crumbBgs = document.querySelectorAll('.crumb-bg');
+            const lastCrumb = crumbBgs.length ? crumbBgs[crumbBgs.length - 1] : null;
+            if (!lastCrumb) {
+                return true;
+            }
+            const color = window.getComputedStyle(lastCrumb).backgroundColor;
+            return color === 'rgb(245, 245, 245)';
+        },
+        currentLang() {
+            return document.querySelector('div.display-language.button > div:nth-child(2)')?.innerText || null;
+        },
+        selectEnglish() {
+            const option = document.querySelector('.language-selector .option:nth-child(23)');
+            option?.click();
+            return null;
+        },
+        challengeState() {
+            const questionText = document.querySelector('.prompt-text')?.textContent?.trim() || null;
+            return {
+                question: questionText,
+                hasGrid: !!document.querySelector('.task-grid'),
+                tileCount: document.querySelectorAll('.task-grid .image').length,
+                hasHeader: !!document.querySelector('.challenge-header'),
+                hasCanvas: !!document.querySelector('canvas'),
+            };
+        },
+        tileRects() {
+            const grid = document.querySelector('.task-grid');
+            if (!grid) {
+                return [];
+            }
+            return Array.from(grid.querySelectorAll('.image, .task')).map((tile) => {
+                const rect = tile.getBoundingClientRect();
+                return [rect.x, rect.y, rect.width, rect.height];
+            });
+        },
+    };
+    Object.defineProperty(window, '__hsolve', { value: probes });
+
+    let lastReported = null;
+    let pending = false;
+    const report = () => {
+        pending = false;
+        const state = { isLast: probes.isLastTask(), lang: probes.currentLang() };
+        if (lastReported && lastReported.isLast === state.isLast && lastReported.lang === state.lang) {
+            return;
+        }
+        lastReported = state;
+        window.__hsolveState(state);
+    };
+    const schedule = () => {
+        if (!pending) {
+            pending = true;
+            setTimeout(report, 50);
+        }
+    };
+    const watch = () => {
+        if (typeof window.__hsolveState !== 'function' || !document.documentElement) {
+            return;
+        }
+        new MutationObserver(schedule).observe(document.documentElement, {
+            subtree: true,
+            childList: true,
+            attributes: true,
+            characterData: true,
+        });
+        schedule();
+    };
+    if (location.href.includes('#frame=challenge')) {
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', watch, { once: true });
+        } else {
+            watch();
+        }
+    }
+})()
+"""
+
+
+def _as_point_list(points: Any) -> Any:
+    """
+    Wraps a single [x, y, ...] point so it can be scanned like a path. The
+    JSON-decoded list-of-lists shape is recognised by exact type first.
+    """
+    if points.__class__ is list and points[0].__class__ is list:
+        return points
+    if isinstance(points, _LT) and not isinstance(points[0], _LT):
+        return (points,)
+    return points
+
+
+def _points_within(
+    points: Iterable[Any],
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+) -> bool:
+    """
+    Returns False on the first [x, y, ...] entry that falls outside the bounds.
+    Entries that are not numeric pairs are ignored. The bounds arrive as plain
+    float arguments so the per-point loop never reaches back into the solver.
+    """
+    for entry in points:
+        if not isinstance(entry, _LT) or len(entry) < 2:
+            continue
+        px = entry[0]
+        py = entry[1]
+        if px.__class__ not in _NUMERIC or py.__class__ not in _NUMERIC:
+            try:
+                px = float(px)
+                py = float(py)
+            except (TypeError, ValueError):
+                continue
+        if (px < min_x) | (py < min_y) | (px > max_x) | (py > max_y):
+            return False
+    return True
+
+
+async def _run_concurrently(*coros: Coroutine[Any, Any, Any]) -> List[Any]:
+    """
+    Runs coroutines concurrently and returns their results in order. A TaskGroup
+    (Python 3.11+) cancels the siblings as soon as one fails; older interpreters
+    fall back to asyncio.gather.
+    """
+    task_group = getattr(asyncio, "TaskGroup", None)
+    if task_group is None:
+        return list(await asyncio.gather(*coros))
+    async with task_group() as group:
+        tasks = [group.create_task(coro) for coro in coros]
+    return [task.result() for task in tasks]
+
 
 class HCaptchaSolver:
     """
@@ -29,8 +199,45 @@ class HCaptchaSolver:
         last_mouse_position: Optional cursor coordinates to resume from between solver runs.
         intercept_token: When True, intercepts the hCaptcha network response and returns
             the token immediately without waiting for page scripts.
+        api_service: Optional shared CaptchaAPIService, so concurrent solvers reuse one
+            request context (and its keep-alive connections) instead of one per page.
+        eager_tasks: When True (Python 3.12+), installs asyncio.eager_task_factory on the
+            running loop if no other task factory is set, so tasks that finish without
+            suspending skip a trip through the scheduler. This affects the whole loop.
+        webp_canvas: When True, canvas challenge bodies are read straight from the canvas
+            as WebP (smaller uploads); falls back to a JPEG screenshot whenever the canvas
+            is tainted, scaled, or the browser cannot encode WebP.
+        poll_interval, poll_backoff, poll_max: Optional per-solver overrides for the
+            Multibot result polling schedule (initial interval, growth factor per
+            not-ready response, and interval cap, in seconds); None keeps the
+            api_service settings.
     """
 
+    __slots__ = (
+        "page",
+        "api_key",
+        "motion",
+        "api_service",
+        "attempt",
+        "intercept_token",
+        "eager_tasks",
+        "webp_canvas",
+        "poll_interval",
+        "poll_backoff",
+        "poll_max",
+        "token",
+        "checkbox_frame",
+        "challenge_frame",
+        "_last_pos",
+        "_token_event",
+        "_response_listener_attached",
+        "_probes_registered",
+        "_observed_state",
+        "_submit_handle_cache",
+        "_frame_listener_attached",
+        "_geom_cache",
+    )
+
     def __init__(
         self,
         page: Page,
@@ -38,42 +245,73 @@ class HCaptchaSolver:
         attempt: int = 10,
         last_mouse_position: Optional[Dict[str, float]] = None,
         intercept_token: bool = False,
+        api_service: Optional[CaptchaAPIService] = None,
+        eager_tasks: bool = False,
+        webp_canvas: bool = False,
+        poll_interval: Optional[float] = None,
+        poll_backoff: Optional[float] = None,
+        poll_max: Optional[float] = None,
     ) -> None:
         self.page = page
         self.api_key = api_key
         self.motion = MouseMotion(page)
-        self.api_service = CaptchaAPIService(
+        self.api_service = api_service or CaptchaAPIService(
             page.context.request,
             api_key,
         )
         self.attempt = attempt
         self.intercept_token = intercept_token
+        self.eager_tasks = eager_tasks
+        self.webp_canvas = webp_canvas
+        self.poll_interval = poll_interval
+        self.poll_backoff = poll_backoff
+        self.poll_max = poll_max
         viewport = getattr(page, "viewport_size", None) or {}
         width = viewport.get("width") or 1920
         height = viewport.get("height") or 1080
-        default_position = {
-            "x": width * 0.45 + random.random() * width * 0.1,
-            "y": height * 0.45 + random.random() * height * 0.1,
-        }
+        default_x = width * 0.45 + random.random() * width * 0.1
+        default_y = height * 0.45 + random.random() * height * 0.1
         if last_mouse_position is not None:
-            self.last_mouse_position = {
-                "x": float(last_mouse_position.get("x", default_position["x"])),
-                "y": float(last_mouse_position.get("y", default_position["y"])),
-            }
+            self._last_pos: Tuple[float, float] = (
+                float(last_mouse_position.get("x", default_x)),
+                float(last_mouse_position.get("y", default_y)),
+            )
         else:
-            self.last_mouse_position = default_position
+            self._last_pos = (default_x, default_y)
         self.token = None
         self.checkbox_frame = None
         self.challenge_frame = None
         self._token_event = asyncio.Event()
         self._response_listener_attached = False
+        self._probes_registered = False
+        # Latest crumb/language state pushed by the in-page observer, keyed by frame id.
+        self._observed_state: Dict[int, Tuple[Frame, Dict[str, Any]]] = {}
+        # Submit button handle per frame id; entries vanish once Playwright drops the handle.
+        self._submit_handle_cache: "weakref.WeakValueDictionary[int, ElementHandle]" = weakref.WeakValueDictionary()
+        self._frame_listener_attached = False
+        # Element geometry memoized for the current challenge round, keyed by (frame id, key).
+        self._geom_cache: Dict[Tuple[int, str], Any] = {}
         
+    @property
+    def last_mouse_position(self) -> Dict[str, float]:
+        """
+        Last known cursor position, in the same {"x", "y"} form accepted by __init__.
+        """
+        x, y = self._last_pos
+        return {"x": x, "y": y}
+
+    @last_mouse_position.setter
+    def last_mouse_position(self, position: Dict[str, float]) -> None:
+        self._last_pos = (float(position["x"]), float(position["y"]))
+
     def _get_last_mouse_position(self) -> Tuple[float, float]:
-        position = self.last_mouse_position
-        return float(position["x"]), float(position["y"])
+        return self._last_pos
 
     def _set_last_mouse_position(self, x: float, y: float) -> None:
-        self.last_mouse_position = {"x": float(x), "y": float(y)}
+        self._last_pos = (x, y)
+
+    def _token_ready(self) -> bool:
+        return self._token_event.is_set() or bool(self.token)
 
     async def _token_aware_sleep(self, delay: float) -> None:
         if delay <= 0:
@@ -81,19 +319,13 @@ class HCaptchaSolver:
         if not self.intercept_token:
             await asyncio.sleep(delay)
             return
-        if self.token or self._token_event.is_set():
+        if self._token_ready():
             return
 
-        sleep_task = asyncio.create_task(asyncio.sleep(delay))
-        event_task = asyncio.create_task(self._token_event.wait())
-        done, pending = await asyncio.wait(
-            [sleep_task, event_task],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        for task in pending:
-            task.cancel()
-        if pending:
-            await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await asyncio.wait_for(self._token_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
 
     async def _handle_checkbox(self) -> bool:
         """
@@ -117,8 +349,8 @@ class HCaptchaSolver:
             await asyncio.sleep(0.5)
             return True
 
-        target_x = box["x"] + box["width"] / 2
-        target_y = box["y"] + box["height"] / 2
+        target_x = box["x"] + box["width"] * 0.5
+        target_y = box["y"] + box["height"] * 0.5
         start_x, start_y = self._get_last_mouse_position()
 
         human_path = await self.api_service.request_human_move([[start_x, start_y], [target_x, target_y]])
@@ -149,9 +381,11 @@ class HCaptchaSolver:
         if frame is None:
             return False
 
+        self._geom_cache.clear()
         await self._ensure_english_language()
 
-        task_payload = await self._collect_challenge_data()
+        frame_offset = await self._frame_offset(frame)
+        task_payload = await self._collect_challenge_data(frame_offset=frame_offset)
         if not task_payload:
             return False
 
@@ -160,26 +394,32 @@ class HCaptchaSolver:
         if not task_id:
             return False
 
-        answers = await self.api_service.wait_for_result(task_id)
+        answers = await self.api_service.wait_for_result(
+            task_id,
+            poll_interval=self.poll_interval,
+            poll_backoff=self.poll_backoff,
+            poll_max=self.poll_max,
+        )
         if not answers:
             return False
 
-        if self.token:
+        if self._token_ready():
             return True
 
-        applied = await self._apply_answers(frame, request_type, answers)
+        applied = await self._apply_answers(
+            frame,
+            request_type,
+            answers,
+            frame_offset=frame_offset,
+        )
         if not applied:
             return False
 
-        if self.token:
-            return True
-
-        if self.token:
+        if self._token_ready():
             return True
 
+        # _token_aware_sleep returns immediately once the token has arrived.
         delay = 5 if await self._is_last_task() else 1
-        if self.token:
-            return True
         await self._token_aware_sleep(delay)
         return True
 
@@ -192,14 +432,24 @@ class HCaptchaSolver:
         if self._token_event.is_set():
             self._token_event.clear()
 
+        if self.eager_tasks:
+            self._install_eager_task_factory()
+
         if self.intercept_token:
             await self._ensure_network_listener()
 
+        await self._register_probes()
+        self._ensure_frame_listener()
+
         for _ in range(self.attempt):
             if self.token:
                 return self.token
 
-            token = await self.wait_token(1_000)
+            if self.intercept_token:
+                # The route handler sets the token as soon as it arrives; just check it.
+                token = self.token if self._token_event.is_set() else None
+            else:
+                token = await self.wait_token(1_000)
             if token:
                 self.token = token
                 return self.token
@@ -221,6 +471,15 @@ class HCaptchaSolver:
 
         return self.token
 
+    @staticmethod
+    def _install_eager_task_factory() -> None:
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is None:
+            return
+        loop = asyncio.get_running_loop()
+        if loop.get_task_factory() is None:
+            loop.set_task_factory(eager_factory)
+
     async def wait_token(self, timeout: int = 10_000) -> Optional[str]:
         if self.token:
             return self.token
@@ -263,6 +522,22 @@ class HCaptchaSolver:
         except Exception:  # noqa: BLE001
             return None
 
+    def _ensure_frame_listener(self) -> None:
+        if self._frame_listener_attached:
+            return
+        try:
+            self.page.on("framenavigated", self._forget_frame)
+            self.page.on("framedetached", self._forget_frame)
+        except Exception:  # noqa: BLE001
+            return
+        self._frame_listener_attached = True
+
+    def _forget_frame(self, frame: Frame) -> None:
+        # Playwright reuses the Frame object across navigations, so anything learned
+        # about the previous document has to go.
+        self._submit_handle_cache.pop(id(frame), None)
+        self._observed_state.pop(id(frame), None)
+
     async def _ensure_network_listener(self) -> None:
         if not self.intercept_token or self._response_listener_attached:
             return
@@ -296,76 +571,96 @@ class HCaptchaSolver:
         await self.page.route("**/checkcaptcha/**", _route_handler)
         self._response_listener_attached = True
  
+    def _observed(self, frame: Optional[Frame]) -> Optional[Dict[str, Any]]:
+        entry = self._observed_state.get(id(frame))
+        if entry is None or entry[0] is not frame:
+            return None
+        return entry[1]
+
+    def _on_observed_state(self, source: Dict[str, Any], state: Any) -> None:
+        frame = source.get("frame")
+        if frame is not None and isinstance(state, dict):
+            self._observed_state[id(frame)] = (frame, state)
+
     async def _is_last_task(self) -> bool:
+        observed = self._observed(self.challenge_frame)
+        if observed is not None:
+            return bool(observed.get("isLast"))
         try:
-            result = await self.challenge_frame.evaluate(
-                """
-                () => {
-                    const crumbBgs = document.querySelectorAll('.crumb-bg');
-                    const lastCrumb = crumbBgs.length ? crumbBgs[crumbBgs.length - 1] : null;
-                    if (!lastCrumb) {
-                        return true;
-                    }
-                    const color = window.getComputedStyle(lastCrumb).backgroundColor;
-                    return color === 'rgb(245, 245, 245)';
-                }
-                """
-            )
+            result = await self._run_probe(self.challenge_frame, "isLastTask")
             return bool(result)
         except Exception:
             return True
  
  
     async def _find_challenge_visual_frame(self) -> Optional[Frame]:
-        for frame in self.page.frames:
-            url = frame.url or ""
-            if "#frame=challenge" in url:
-                question = await frame.evaluate(
-                    "() => document.querySelector('h2.prompt-text')"
-                )
-                if question:
-                    return frame
-        return None
+        return await self._probe_frames("#frame=challenge", "hasPrompt")
     
     
     async def _find_checkbox_frame(self) -> Optional[Frame]:
-        for frame in self.page.frames:
-            url = frame.url or ""
-            if "#frame=checkbox" in url:
-                pulse_is_hidden = await frame.evaluate(
-                    """
-                    () => {
-                        const pulseElement = document.querySelector("#anchor-state > div.pulse");
-                        if (!pulseElement) {
-                            return false;
-                        }
-                        return window.getComputedStyle(pulseElement).display === "none";
-                    }
-                    """
-                )
-                if pulse_is_hidden:
-                    return frame
+        return await self._probe_frames("#frame=checkbox", "pulseHidden")
+
+    async def _register_probes(self) -> None:
+        """
+        Exposes the state binding the challenge-frame observer reports through.
+        The probe helpers themselves are not registered page-wide: _run_probe
+        installs them on first use, and only in the frames it actually probes.
+        """
+        if self._probes_registered:
+            return
+        try:
+            await self.page.expose_binding("__hsolveState", self._on_observed_state)
+        except Exception:  # noqa: BLE001
+            pass
+        self._probes_registered = True
+
+    @staticmethod
+    async def _run_probe(frame: Frame, name: str) -> Any:
+        """
+        Calls window.__hsolve.<name>() in frame, installing the helpers first if the
+        frame's current document does not have them yet.
+        """
+        installed, value = await frame.evaluate(
+            f"() => window.__hsolve ? [true, window.__hsolve.{name}()] : [false, null]"
+        )
+        if installed:
+            return value
+        await frame.evaluate(_PROBES_SCRIPT)
+        return await frame.evaluate(f"() => window.__hsolve.{name}()")
+
+    async def _probe_frames(self, url_marker: str, probe: str) -> Optional[Frame]:
+        """
+        Runs the named probe concurrently in every frame whose URL contains
+        url_marker and returns the first frame (in page order) for which it is true.
+        """
+        candidates = [frame for frame in self.page.frames if url_marker in (frame.url or "")]
+        if not candidates:
+            return None
+
+        async def run_probe(frame: Frame) -> Any:
+            try:
+                return await self._run_probe(frame, probe)
+            except Exception:  # noqa: BLE001
+                # Frames can detach mid-probe; treat them as a miss.
+                return None
+
+        results = await _run_concurrently(*(run_probe(frame) for frame in candidates))
+        for frame, matched in zip(candidates, results):
+            if matched is True:
+                return frame
         return None
         
 
     async def _ensure_english_language(self) -> None:
+        observed = self._observed(self.challenge_frame)
+        if observed is not None and observed.get("lang") == "EN":
+            return
         try:
-            current_lang = await self.challenge_frame.evaluate(
-                """
-                () => document.querySelector('div.display-language.button > div:nth-child(2)')?.innerText || null
-                """
-            )
+            current_lang = await self._run_probe(self.challenge_frame, "currentLang")
             if current_lang == "EN":
                 return
 
-            await self.challenge_frame.evaluate(
-                """
-                () => {
-                    const option = document.querySelector('.language-selector .option:nth-child(23)');
-                    option?.click();
-                }
-                """
-            )
+            await self._run_probe(self.challenge_frame, "selectEnglish")
             await asyncio.sleep(0.2)
         except Exception:  # noqa: BLE001
             pass
@@ -388,6 +683,33 @@ class HCaptchaSolver:
         result = base64.b64encode(bytes_data).decode("ascii")
         return result
 
+    @staticmethod
+    async def _canvas_to_webp_base64(canvas: ElementHandle, *, quality: float = 0.82) -> Optional[str]:
+        """
+        Encodes the canvas bitmap as WebP in the page and returns the base64 payload.
+        Returns None when the bitmap is scaled relative to its on-screen size (answer
+        coordinates would no longer match), the canvas is tainted, or the browser
+        does not support WebP encoding.
+        """
+        try:
+            data_url = await canvas.evaluate(
+                """
+                (canvas, quality) => {
+                    if (canvas.width !== canvas.clientWidth || canvas.height !== canvas.clientHeight) {
+                        return null;
+                    }
+                    const url = canvas.toDataURL('image/webp', quality);
+                    return url.startsWith('data:image/webp') ? url : null;
+                }
+                """,
+                quality,
+            )
+        except Exception:  # noqa: BLE001
+            return None
+        if not data_url:
+            return None
+        return data_url.partition(",")[2] or None
+
 
     async def _collect_example_images(
         self,
@@ -402,39 +724,41 @@ class HCaptchaSolver:
         except Exception:  # noqa: BLE001
             return []
 
-        results: List[str] = []
-        for element in elements:
-            try:
-                encoded = await self._element_to_base64(element)
-            except Exception:  # noqa: BLE001
-                encoded = None
-            if encoded:
-                results.append(encoded)
+        async def dispose(element: ElementHandle) -> None:
             try:
                 await element.dispose()
             except Exception:  # noqa: BLE001
                 pass
-        return results
 
+        encoded_images = await _run_concurrently(
+            *(self._element_to_base64(element) for element in elements)
+        )
+        await _run_concurrently(*(dispose(element) for element in elements))
+        return [encoded for encoded in encoded_images if encoded]
 
-    async def _collect_challenge_data(self) -> Optional[Dict[str, Any]]:
+
+    async def _collect_challenge_data(
+        self,
+        *,
+        frame_offset: Tuple[float, float] = (0.0, 0.0),
+    ) -> Optional[Dict[str, Any]]:
         frame = self.challenge_frame
         if frame is None:
             return None
 
-        question = await frame.evaluate(
-            "() => document.querySelector('.prompt-text')?.textContent?.trim() || null"
-        )
-        if not question:
+        state = await self._run_probe(frame, "challengeState")
+        if not state or not state.get("question"):
             return None
 
-        payload = await self._collect_grid_challenge(frame, question)
-        if not payload:
-            payload = await self._collect_canvas_challenge(frame, question)
+        payload = None
+        if state.get("hasGrid") and state.get("tileCount") == 9:
+            payload = await self._collect_grid_challenge(frame, state)
+        if not payload and state.get("hasCanvas"):
+            payload = await self._collect_canvas_challenge(frame, state)
         if not payload:
             return None
 
-        human_move_payload = await self._build_human_move_payload(frame)
+        human_move_payload = await self._build_human_move_payload(frame, frame_offset)
         if human_move_payload:
             payload["humanMove"] = human_move_payload
 
@@ -443,68 +767,74 @@ class HCaptchaSolver:
     async def _collect_grid_challenge(
         self,
         frame: Frame,
-        question: str,
+        state: Dict[str, Any],
     ) -> Optional[Dict[str, Any]]:
         grid = await frame.query_selector(".task-grid")
         if not grid:
             return None
 
-        tiles = await frame.query_selector_all(".task-grid .image")
-        if len(tiles) != 9:
-            return None
-
         await asyncio.sleep(1.0)
-        body = await self._element_to_base64(grid)
+        body, examples = await _run_concurrently(
+            self._element_to_base64(grid),
+            self._collect_example_images(".challenge-example .image"),
+        )
         if not body:
             return None
 
-        examples = await self._collect_example_images(".challenge-example .image")
         return {
-            "question": question,
+            "question": state["question"],
             "request_type": "Grid",
             "body": body,
             "examples": examples,
         }
 
+    async def _canvas_body(self, canvas: ElementHandle) -> Optional[str]:
+        if self.webp_canvas:
+            body = await self._canvas_to_webp_base64(canvas)
+            if body:
+                return body
+        return await self._element_to_base64(canvas, quality=92)
+
+    @staticmethod
+    def _canvas_request_type(state: Dict[str, Any]) -> str:
+        """
+        Classifies a canvas challenge from the fused state probe: click-style
+        canvases carry a .challenge-header, drag puzzles do not (or say "drag").
+        """
+        if state.get("hasHeader") and "drag" not in state["question"].lower():
+            return "Canvas"
+        return "Drag"
+
     async def _collect_canvas_challenge(
         self,
         frame: Frame,
-        question: str,
+        state: Dict[str, Any],
     ) -> Optional[Dict[str, Any]]:
         canvas = await self._find_primary_canvas(frame)
         if not canvas:
             return None
 
         await asyncio.sleep(1.0)
-        body = await self._element_to_base64(canvas, quality=92)
+        body, examples = await _run_concurrently(
+            self._canvas_body(canvas),
+            self._collect_example_images(".example-wrapper .image"),
+        )
         if not body:
             return None
 
-        has_header = await frame.query_selector(".challenge-header") is not None
-        question_lower = question.lower()
-        is_canvas = has_header and "drag" not in question_lower
-        request_type = "Canvas" if is_canvas else "Drag"
-        examples = await self._collect_example_images(".example-wrapper .image")
-
         return {
-            "question": question,
-            "request_type": request_type,
+            "question": state["question"],
+            "request_type": self._canvas_request_type(state),
             "body": body,
             "examples": examples,
         }
 
-    async def _build_human_move_payload(self, frame: Frame) -> Optional[List[List[float]]]:
-        frame_offset_x = 0.0
-        frame_offset_y = 0.0
-        try:
-            frame_element = await frame.frame_element()
-            if frame_element:
-                frame_box = await frame_element.bounding_box()
-                if frame_box:
-                    frame_offset_x = float(frame_box["x"])
-                    frame_offset_y = float(frame_box["y"])
-        except Exception:  # noqa: BLE001
-            pass
+    async def _build_human_move_payload(
+        self,
+        frame: Frame,
+        frame_offset: Tuple[float, float],
+    ) -> Optional[List[List[float]]]:
+        frame_offset_x, frame_offset_y = frame_offset
 
         current_position = self.motion.current_position
         if current_position:
@@ -512,18 +842,12 @@ class HCaptchaSolver:
         else:
             start_x, start_y = self._get_last_mouse_position()
 
-        submit_button = await frame.query_selector(".button-submit")
-        if not submit_button:
-            submit_button = await frame.query_selector('button[type="submit"]')
-        if not submit_button:
-            return None
-
-        submit_box = await submit_button.bounding_box()
+        submit_box = await self._cached_submit_box(frame)
         if not submit_box:
             return None
 
-        submit_center_x = float(submit_box["x"] + submit_box["width"] / 2)
-        submit_center_y = float(submit_box["y"] + submit_box["height"] / 2)
+        submit_center_x = submit_box["x"] + submit_box["width"] * 0.5
+        submit_center_y = submit_box["y"] + submit_box["height"] * 0.5
 
         start_point = [
             max(0.0, round(start_x - frame_offset_x, 2)),
@@ -540,6 +864,100 @@ class HCaptchaSolver:
         ]
         return payload
 
+    async def _frame_offset(self, frame: Frame) -> Tuple[float, float]:
+        """
+        Page coordinates of the frame's top-left corner, cached for the round.
+        """
+        async def load() -> Tuple[float, float]:
+            try:
+                frame_element = await frame.frame_element()
+                if frame_element:
+                    frame_box = await frame_element.bounding_box()
+                    if frame_box:
+                        return float(frame_box["x"]), float(frame_box["y"])
+            except Exception:  # noqa: BLE001
+                pass
+            return 0.0, 0.0
+
+        return await self._cached_geometry(frame, "frame_offset", load)
+
+    async def _cached_geometry(
+        self,
+        frame: Frame,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Returns loader()'s result, memoized per frame for the current challenge round.
+        """
+        cache_key = (id(frame), key)
+        if cache_key not in self._geom_cache:
+            self._geom_cache[cache_key] = await loader()
+        return self._geom_cache[cache_key]
+
+    async def _cached_box(self, frame: Frame, selector: str) -> Optional[Dict[str, float]]:
+        async def load() -> Optional[Dict[str, float]]:
+            element = await frame.query_selector(selector)
+            if not element:
+                return None
+            return await element.bounding_box()
+
+        return await self._cached_geometry(frame, selector, load)
+
+    async def _submit_box(self, frame: Frame) -> Optional[Dict[str, float]]:
+        """
+        Live bounding box of the submit button. The element handle is reused across
+        rounds (while the frame listener can invalidate it) so only bounding_box()
+        goes to the browser; a handle that no longer has a box is re-queried once.
+        """
+        key = id(frame)
+        submit = self._submit_handle_cache.get(key)
+        if submit is not None:
+            box = await submit.bounding_box()
+            if box:
+                return box
+            self._submit_handle_cache.pop(key, None)
+
+        submit = await frame.query_selector(_SUBMIT_SELECTOR)
+        if not submit:
+            return None
+        if self._frame_listener_attached:
+            self._submit_handle_cache[key] = submit
+        return await submit.bounding_box()
+
+    async def _cached_submit_box(self, frame: Frame) -> Optional[Dict[str, float]]:
+        return await self._cached_geometry(frame, "submit", lambda: self._submit_box(frame))
+
+    async def _cached_canvas_box(self, frame: Frame) -> Optional[Dict[str, float]]:
+        async def load() -> Optional[Dict[str, float]]:
+            canvas = await self._find_primary_canvas(frame)
+            if not canvas:
+                return None
+            return await canvas.bounding_box()
+
+        return await self._cached_geometry(frame, "canvas", load)
+
+    async def _cached_tile_boxes(self, frame: Frame) -> List[Optional[Dict[str, float]]]:
+        """
+        Bounding boxes of the grid tiles in DOM order (None where a tile has no box).
+        All tile rects are read in one evaluate and shifted by the frame offset into
+        page coordinates, matching what ElementHandle.bounding_box() reports.
+        """
+        async def load() -> List[Optional[Dict[str, float]]]:
+            rects = await self._run_probe(frame, "tileRects")
+            offset_x, offset_y = await self._frame_offset(frame)
+            boxes: List[Optional[Dict[str, float]]] = []
+            for x, y, width, height in rects or []:
+                if width <= 0 or height <= 0:
+                    boxes.append(None)
+                    continue
+                boxes.append(
+                    {"x": offset_x + x, "y": offset_y + y, "width": width, "height": height}
+                )
+            return boxes
+
+        return await self._cached_geometry(frame, "tiles", load)
+
     async def _find_primary_canvas(self, frame: Frame) -> Optional[ElementHandle]:
         canvases = await frame.query_selector_all("canvas")
         for canvas in canvases:
@@ -556,23 +974,29 @@ class HCaptchaSolver:
         frame: Frame,
         request_type: str,
         answers: Union[List[Any], Dict[str, Any]],
+        *,
+        frame_offset: Tuple[float, float] = (0.0, 0.0),
     ) -> bool:
         try:
             if isinstance(answers, dict):
                 actions = answers.get("actions") or answers.get("steps")
-                if isinstance(actions, Sequence):
-                    return await self._execute_actions(frame, request_type, list(actions))
+                if isinstance(actions, _LT):
+                    return await self._execute_actions(
+                        frame, request_type, list(actions), frame_offset
+                    )
                 answers_list = answers.get("answers")
-                if isinstance(answers_list, Sequence):
+                if isinstance(answers_list, _LT):
                     answers = list(answers_list)
                 else:
                     return False
 
-            if not isinstance(answers, Sequence):
+            if not isinstance(answers, _LT):
                 return False
 
             if answers and isinstance(answers[0], dict):
-                return await self._execute_actions(frame, request_type, list(answers))  # type: ignore[arg-type]
+                return await self._execute_actions(
+                    frame, request_type, list(answers), frame_offset  # type: ignore[arg-type]
+                )
 
             if request_type == "Grid":
                 indices = [int(index) for index in answers]
@@ -596,56 +1020,22 @@ class HCaptchaSolver:
         frame: Frame,
         request_type: str,
         actions: List[Dict[str, Any]],
+        frame_offset: Tuple[float, float],
     ) -> bool:
         if not actions:
             return False
 
         if request_type == "Grid":
-            target_root = await frame.query_selector(".task-grid")
+            root_box = await self._cached_box(frame, ".task-grid")
         else:
-            target_root = await self._find_primary_canvas(frame)
-
-        submit_button = await frame.query_selector(".button-submit")
-        if not target_root or not submit_button:
-            return False
+            root_box = await self._cached_canvas_box(frame)
 
-        root_box = await target_root.bounding_box()
-        submit_box = await submit_button.bounding_box()
+        submit_box = await self._cached_submit_box(frame)
         if not root_box or not submit_box:
             return False
 
-        frame_offset_x = 0.0
-        frame_offset_y = 0.0
-        try:
-            frame_element = await frame.frame_element()
-            if frame_element:
-                frame_box = await frame_element.bounding_box()
-                if frame_box:
-                    frame_offset_x = float(frame_box["x"])
-                    frame_offset_y = float(frame_box["y"])
-        except Exception:  # noqa: BLE001
-            pass
-
         canvas_relative = request_type in {"Canvas", "Drag"} and self._is_canvas_path_relative(actions, root_box)
-
-        grid_margin_x = float(root_box.get("width", 0.0) * 0.25 + 40.0)
-        grid_margin_y = float(root_box.get("height", 0.0) * 0.25 + 40.0)
-
-        def point_converter(px: Any, py: Any) -> Tuple[float, float]:
-            x = float(px)
-            y = float(py)
-            if request_type == "Grid":
-                within_x = -grid_margin_x <= x <= root_box["width"] + grid_margin_x
-                within_y = -grid_margin_y <= y <= root_box["height"] + grid_margin_y
-                if within_x and within_y:
-                    return (root_box["x"] + x, root_box["y"] + y)
-                return (frame_offset_x + x, frame_offset_y + y)
-            if request_type in {"Canvas", "Drag"}:
-                return (
-                    root_box["x"] + x if canvas_relative else frame_offset_x + x,
-                    root_box["y"] + y if canvas_relative else frame_offset_y + y,
-                )
-            return (frame_offset_x + x, frame_offset_y + y)
+        point_converter = self._make_point_converter(request_type, root_box, frame_offset, canvas_relative)
 
         did_anything = False
         last_position: Optional[Tuple[float, float]] = None
@@ -692,13 +1082,13 @@ class HCaptchaSolver:
                 last_x, last_y, _ = converted_path[-1]
                 last_position = (last_x, last_y)
                 did_anything = True
-                if submit_box and self._point_inside_box(submit_box, last_x, last_y):
+                if submit_box and self._pt_in_pw_box(submit_box, last_x, last_y):
                     await self.motion.move_direct(last_x, last_y)
                     await self.motion.click_here()
                     self._set_last_mouse_position(last_x, last_y)
                     continue
                 if request_type == "Grid":
-                    await self._click_grid_coordinate(target_root, last_x, last_y)
+                    await self._click_grid_coordinate(frame, last_x, last_y)
                 else:
                     await self.motion.move_direct(last_x, last_y)
                     await self.motion.click_here()
@@ -717,6 +1107,48 @@ class HCaptchaSolver:
 
         return did_anything
 
+    @staticmethod
+    def _make_point_converter(
+        request_type: str,
+        root_box: Dict[str, float],
+        frame_offset: Tuple[float, float],
+        canvas_relative: bool,
+    ) -> Callable[[Any, Any], Tuple[float, float]]:
+        """
+        Returns a point converter specialised for request_type, with the
+        request-type branch and box bounds resolved once instead of per point.
+        """
+        frame_offset_x, frame_offset_y = frame_offset
+        root_x = root_box["x"]
+        root_y = root_box["y"]
+
+        if request_type == "Grid":
+            grid_margin_x = float(root_box.get("width", 0.0) * 0.25 + 40.0)
+            grid_margin_y = float(root_box.get("height", 0.0) * 0.25 + 40.0)
+            min_x = -grid_margin_x
+            max_x = root_box["width"] + grid_margin_x
+            min_y = -grid_margin_y
+            max_y = root_box["height"] + grid_margin_y
+
+            def grid_converter(px: Any, py: Any) -> Tuple[float, float]:
+                x = float(px)
+                y = float(py)
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    return (root_x + x, root_y + y)
+                return (frame_offset_x + x, frame_offset_y + y)
+
+            return grid_converter
+
+        if request_type in {"Canvas", "Drag"} and canvas_relative:
+            shift_x, shift_y = root_x, root_y
+        else:
+            shift_x, shift_y = frame_offset_x, frame_offset_y
+
+        def shift_converter(px: Any, py: Any) -> Tuple[float, float]:
+            return (shift_x + float(px), shift_y + float(py))
+
+        return shift_converter
+
     def _convert_action_path(
         self,
         converter,
@@ -724,7 +1156,9 @@ class HCaptchaSolver:
     ) -> List[Tuple[float, float, Optional[float]]]:
         converted: List[Tuple[float, float, Optional[float]]] = []
         for entry in path:
-            if not isinstance(entry, (list, tuple)) or len(entry) < 2:
+            if type(entry) not in _LT and not isinstance(entry, _LT):
+                continue
+            if len(entry) < 2:
                 continue
             try:
                 x, y = converter(entry[0], entry[1])
@@ -751,91 +1185,91 @@ class HCaptchaSolver:
         await self.motion.move_direct(first_x, first_y, delay=initial_delay)
         await self.page.mouse.down()
 
+        move_direct = self.motion.move_direct
         for x, y, delay in path_points[1:]:
-            await self.motion.move_direct(x, y, delay=delay)
+            await move_direct(x, y, delay=delay)
 
         await self.page.mouse.up()
         self._set_last_mouse_position(path_points[-1][0], path_points[-1][1])
 
-    async def _click_grid_coordinate(self, grid: ElementHandle, x: float, y: float) -> None:
-        tile = await self._find_grid_tile(grid, x, y)
-        if tile:
-            box = await tile.bounding_box()
-            if box:
-                target_x = box["x"] + box["width"] / 2
-                target_y = box["y"] + box["height"] / 2
-                await self.motion.move_direct(target_x, target_y)
-                await self.motion.click_here()
-                self._set_last_mouse_position(target_x, target_y)
-                return
+    async def _click_grid_coordinate(self, frame: Frame, x: float, y: float) -> None:
+        box = await self._find_grid_tile(frame, x, y)
+        if box:
+            target_x = box["x"] + box["width"] * 0.5
+            target_y = box["y"] + box["height"] * 0.5
+            await self.motion.move_direct(target_x, target_y)
+            await self.motion.click_here()
+            self._set_last_mouse_position(target_x, target_y)
+            return
         await self.motion.move_direct(x, y)
         await self.motion.click_here()
         self._set_last_mouse_position(x, y)
 
     async def _find_grid_tile(
         self,
-        grid: ElementHandle,
+        frame: Frame,
         x: float,
         y: float,
-    ) -> Optional[ElementHandle]:
-        tiles = await grid.query_selector_all(".task, .image")
-        for tile in tiles:
-            box = await tile.bounding_box()
+    ) -> Optional[Dict[str, float]]:
+        for box in await self._cached_tile_boxes(frame):
             if not box:
                 continue
             within_x = box["x"] <= x <= box["x"] + box["width"]
             within_y = box["y"] <= y <= box["y"] + box["height"]
             if within_x and within_y:
-                return tile
+                return box
         return None
 
     async def _click_grid_tiles(self, frame: Frame, indices: Sequence[int]) -> None:
-        grid = await frame.query_selector(".task-grid")
-        if not grid:
-            return
-
-        tiles = await grid.query_selector_all(".image, .task")
-        for index in indices:
-            if index >= len(tiles):
-                continue
-            tile = tiles[index]
-            box = await tile.bounding_box()
-            if not box:
-                continue
-
-            offset_x = random.uniform(-10, 10)
-            offset_y = random.uniform(-10, 10)
-            target_x = box["x"] + box["width"] / 2 + offset_x
-            target_y = box["y"] + box["height"] / 2 + offset_y
+        tile_boxes = await self._cached_tile_boxes(frame)
+        tile_count = len(tile_boxes)
+        boxes = [tile_boxes[index] for index in indices if index < tile_count]
+        # All click targets (tile centre +/- 10px) are resolved up front so the
+        # loop below only awaits the motion calls.
+        rand = random.random
+        targets = [
+            (
+                box["x"] + box["width"] * 0.5 + 20.0 * rand() - 10.0,
+                box["y"] + box["height"] * 0.5 + 20.0 * rand() - 10.0,
+            )
+            for box in boxes
+            if box
+        ]
 
-            await self.motion.move_direct(target_x, target_y)
-            await self.motion.click_here()
-            self._set_last_mouse_position(target_x, target_y)
+        move_direct = self.motion.move_direct
+        click_here = self.motion.click_here
+        set_position = self._set_last_mouse_position
+        for target_x, target_y in targets:
+            await move_direct(target_x, target_y)
+            await click_here()
+            set_position(target_x, target_y)
 
     async def _click_canvas_points(self, frame: Frame, points: Sequence[Sequence[float]]) -> None:
-        canvas = await self._find_primary_canvas(frame)
-        if not canvas:
-            return
-        box = await canvas.bounding_box()
+        box = await self._cached_canvas_box(frame)
         if not box:
             return
 
+        box_x = box["x"]
+        box_y = box["y"]
+        click = self.motion.click
+        set_position = self._set_last_mouse_position
         for point in points:
             if len(point) < 2:
                 continue
-            x = box["x"] + float(point[0])
-            y = box["y"] + float(point[1])
-            await self.motion.click(x, y)
-            self._set_last_mouse_position(x, y)
+            x = box_x + float(point[0])
+            y = box_y + float(point[1])
+            await click(x, y)
+            set_position(x, y)
 
     async def _drag_canvas_pairs(self, frame: Frame, coordinates: Sequence[Sequence[float]]) -> None:
-        canvas = await self._find_primary_canvas(frame)
-        if not canvas:
-            return
-        box = await canvas.bounding_box()
+        box = await self._cached_canvas_box(frame)
         if not box:
             return
 
+        box_x = box["x"]
+        box_y = box["y"]
+        drag_and_drop = self.motion.drag_and_drop
+        set_position = self._set_last_mouse_position
         iterator = iter(coordinates)
         for start_point in iterator:
             try:
@@ -850,77 +1284,65 @@ class HCaptchaSolver:
             ):
                 continue
             start = Point(
-                x=box["x"] + float(start_point[0]),
-                y=box["y"] + float(start_point[1]),
+                x=box_x + float(start_point[0]),
+                y=box_y + float(start_point[1]),
             )
             end = Point(
-                x=box["x"] + float(end_point[0]),
-                y=box["y"] + float(end_point[1]),
+                x=box_x + float(end_point[0]),
+                y=box_y + float(end_point[1]),
             )
-            await self.motion.drag_and_drop(start, end, steps=35)
-            self._set_last_mouse_position(end.x, end.y)
+            await drag_and_drop(start, end, steps=_DRAG_STEPS)
+            set_position(end.x, end.y)
 
     @staticmethod
-    def _point_inside_box(
+    def _pt_in_pw_box(
         box: Dict[str, float],
         x: float,
         y: float,
     ) -> bool:
-        left = float(box.get("x", 0.0))
-        top = float(box.get("y", 0.0))
-        width = float(box.get("width", 0.0))
-        height = float(box.get("height", 0.0))
-        right = left + width
-        bottom = top + height
-        return left <= x <= right and top <= y <= bottom
+        """
+        Containment test for a Playwright bounding box, which always carries
+        float x/y/width/height.
+        """
+        left = box["x"]
+        top = box["y"]
+        return (left <= x <= left + box["width"]) & (top <= y <= top + box["height"])
 
     def _is_canvas_path_relative(
         self,
         actions: Sequence[Dict[str, Any]],
         root_box: Dict[str, float],
     ) -> bool:
-        width = root_box.get("width", 0.0)
-        height = root_box.get("height", 0.0)
+        width = float(root_box.get("width", 0.0))
+        height = float(root_box.get("height", 0.0))
         if width <= 0 or height <= 0:
             return False
+        if not actions:
+            return True
 
-        threshold_x = width + 80.0
-        threshold_y = height + 80.0
+        # Bounds are fixed floats for the whole scan and the first point outside
+        # them decides the answer, so the rest of the payload is never touched.
+        min_x = min_y = -80.0
+        max_x = width + 80.0
+        max_y = height + 80.0
 
         for action in actions:
-            for key in ("path", "start", "end"):
-                points = action.get(key)
-                if points is None:
+            get = action.get
+            for key in _CANVAS_POINT_KEYS:
+                points = get(key)
+                if not points:
                     continue
-                if isinstance(points, (list, tuple)) and points and not isinstance(points[0], (list, tuple)):
-                    candidates = (points,)
-                else:
-                    candidates = points or []
-                for entry in candidates:
-                    if not isinstance(entry, (list, tuple)) or len(entry) < 2:
-                        continue
-                    try:
-                        px = float(entry[0])
-                        py = float(entry[1])
-                    except (TypeError, ValueError):
-                        continue
-                    if px < -80.0 or py < -80.0 or px > threshold_x or py > threshold_y:
-                        return False
+                if not _points_within(_as_point_list(points), min_x, min_y, max_x, max_y):
+                    return False
         return True
 
     async def _click_submit_button(self, frame: Frame) -> None:
-        submit = await frame.query_selector(".button-submit")
-        if not submit:
-            submit = await frame.query_selector('button[type="submit"]')
-        if not submit:
-            return
-
-        box = await submit.bounding_box()
+        box = await self._submit_box(frame)
         if not box:
             return
 
-        target_x = box["x"] + box["width"] / 2
-        target_y = box["y"] + box["height"] / 2
+        target_x = box["x"] + box["width"] * 0.5
+        target_y = box["y"] + box["height"] * 0.5
         await self.motion.click(target_x, target_y)
         self._set_last_mouse_position(target_x, target_y)
 
@@ -1,8 +1,11 @@
 import asyncio
+import sys
 import time
+from typing import Iterable, Optional, Tuple
 
-from patchright.async_api import async_playwright
+from patchright.async_api import Page, async_playwright
 
+from core.api_service import CaptchaAPIService
 from core.logger import log
 from core.solver import HCaptchaSolver
 
@@ -10,13 +13,40 @@ from core.solver import HCaptchaSolver
 APIKEY = "Your MultiBot Key" # Your MultiBot Key
 ATTEMPT = 10 # Number of attempts
 INTERCEPT_TOKEN = False # True - Intercept the token
+CONCURRENCY = 1 # Number of browser contexts solving in parallel; the first token wins
+
+
+async def first_token(
+    runs: Iterable[Tuple[Page, HCaptchaSolver]],
+) -> Tuple[Optional[str], Optional[Page]]:
+    """
+    Races solver.solve() across pages and returns the first token with its page.
+    The remaining solvers are cancelled as soon as one succeeds.
+    """
+    tasks = {asyncio.ensure_future(solver.solve()): page for page, solver in runs}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    log.failure(f"Solver crashed: {task.exception()!r}")
+                elif task.result():
+                    return task.result(), tasks[task]
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return None, None
 
 
 async def main() -> None:
     async with async_playwright() as patchright:
         browser = await patchright.chromium.launch(headless=False)
-        context = await browser.new_context()
-        page = await context.new_page()
+        contexts = [await browser.new_context() for _ in range(CONCURRENCY)]
+        pages = [await context.new_page() for context in contexts]
+        page = pages[0]
 
         #-------------------
         #
@@ -25,18 +55,27 @@ async def main() -> None:
         #-------------------
 
         join_url = "https://store.steampowered.com/join/"
-        await page.goto(join_url, wait_until="domcontentloaded")
-
-        solver = HCaptchaSolver(
-            page,
-            APIKEY,
-            attempt=ATTEMPT,
-            intercept_token=INTERCEPT_TOKEN,
+        await asyncio.gather(
+            *(tab.goto(join_url, wait_until="domcontentloaded") for tab in pages)
         )
+
+        # One Multibot client shared by every solver.
+        api_service = CaptchaAPIService(contexts[0].request, APIKEY)
+        solvers = [
+            HCaptchaSolver(
+                tab,
+                APIKEY,
+                attempt=max(1, ATTEMPT // CONCURRENCY),
+                intercept_token=INTERCEPT_TOKEN,
+                api_service=api_service,
+            )
+            for tab in pages
+        ]
         
         start_time = time.time()
-        token = await solver.solve()
+        token, solved_page = await first_token(zip(pages, solvers))
         end_time = time.time()
+        page = solved_page or page
 
         if token:
             log.captcha(f"Captcha solved. Token: {token[:35]}", start_time, end_time)
@@ -49,11 +88,40 @@ async def main() -> None:
         #
         #-------------------
         
-        await browser.close()
+        # Contexts and the browser shut down together; errors from contexts the
+        # browser already took down are ignored.
+        await asyncio.gather(
+            *(context.close() for context in contexts),
+            browser.close(),
+            return_exceptions=True,
+        )
+
+    # Only pause for a human; piped/CI runs exit straight away.
+    if sys.stdin.isatty():
         input("Press Enter to exit...")
 
 
+def run(coro) -> None:
+    """
+    Runs coro on uvloop (winloop on Windows) when installed, else on the stock asyncio loop.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        asyncio.run(coro)
+        return
+
+    if hasattr(fast_loop, "run"):
+        fast_loop.run(coro)
+    else:
+        fast_loop.install()
+        asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
 